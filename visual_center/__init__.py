@@ -1 +1,3 @@
-from .quadtree import find_pole
\ No newline at end of file
+from .polygon import Polygon
+from .quadtree import find_pole, find_pole_polygon
+from .batch import find_poles
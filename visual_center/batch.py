@@ -0,0 +1,216 @@
+"""
+Approximating the pole of inaccessability of many polygons at once.
+
+Runs the same quadtree search as `find_pole`, but advances every polygon in lockstep. The frontier of
+every polygon is kept in flat arrays, and each step evaluates the distances of every cell of every polygon
+with one batched float32 numpy kernel instead of one cv2 call per cell. Polygons are retired as soon as
+they have no cells left to check.
+
+This is much faster than calling `find_pole` in a loop for many small polygons (e.g. labelling contours),
+where the per-call Python overhead dominates.
+"""
+import numpy as np
+from visual_center.polygon import Polygon
+
+# Maximum number of (cell, edge) pairs evaluated at once, to bound the memory used by each step
+_MAX_CHUNK = 1 << 16
+
+
+def _pack_edges(polygons: list[Polygon], origins: np.ndarray) -> np.ndarray:
+    """ Packs the edges of all rings of every polygon into one padded array.
+
+    Each edge is stored as [x0, y0, y1, dx, dy, 1 / length², dx / dy], relative to the polygon's origin
+    so float32 keeps its precision for large coordinates. Zero length and horizontal edges store 0 for
+    the terms they would divide by zero in.
+
+    Polygons with fewer edges are padded with zero length edges on their first vertex. These never
+    change the crossing count and are never closer than the real edges, so no mask is needed.
+
+    Args:
+        polygons (list[Polygon]): The polygons to pack.
+        origins (np.ndarray): The origin of each polygon, of shape (n_polygons, 2).
+
+    Returns:
+        (np.ndarray) The float32 edges of shape (7, n_polygons, max_edges).
+    """
+    rings = [[polygon.shell, *polygon.holes] for polygon in polygons]
+    counts = [sum(len(ring) for ring in poly_rings) for poly_rings in rings]
+    start = np.empty((len(polygons), max(counts), 2), dtype=np.float64)
+    end = np.empty_like(start)
+
+    for i, poly_rings in enumerate(rings):
+        start[i, :counts[i]] = np.concatenate(poly_rings)
+        end[i, :counts[i]] = np.concatenate([np.concatenate([ring[1:], ring[:1]]) for ring in poly_rings])
+        start[i, counts[i]:] = end[i, counts[i]:] = poly_rings[0][0]
+
+    start -= origins[:, None, :]
+    end -= origins[:, None, :]
+    dx, dy = (end - start).transpose(2, 0, 1)
+    length = dx * dx + dy * dy
+    inv_length = np.divide(1, length, out=np.zeros_like(length), where=length > 0)
+    slope = np.divide(dx, dy, out=np.zeros_like(dy), where=dy != 0)
+
+    return np.stack([start[..., 0], start[..., 1], end[..., 1], dx, dy, inv_length, slope]).astype(np.float32)
+
+
+def _signed_distances(edges: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """ Calculates the distance from each point to the edges of its polygon.
+
+    Args:
+        edges (np.ndarray): The packed edges of each point's polygon, of shape (7, n, max_edges).
+            See `_pack_edges`. The array is used as scratch space and overwritten.
+        points (np.ndarray): The points relative to their polygon's origin, of shape (n, 2).
+
+    Returns:
+        (np.ndarray) The distances of shape (n,). Positive if inside the polygon, negative if outside.
+    """
+    px = points[:, 0, None]
+    py = points[:, 1, None]
+    x0, y0, y1, dx, dy, inv_length, slope = edges
+    ux = px - x0
+    uy = py - y0
+
+    # Even-odd rule over every ring, so points inside a hole count as outside
+    crosses = (y0 > py) != (y1 > py)
+    slope *= uy
+    crosses &= ux < slope
+    inside = np.count_nonzero(crosses, axis=1) % 2 == 1
+
+    # Distance to the closest point on each edge
+    t = ux * dx
+    t += uy * dy
+    t *= inv_length
+    np.clip(t, 0, 1, out=t)
+    dx *= t
+    dy *= t
+    ux -= dx
+    uy -= dy
+    ux *= ux
+    uy *= uy
+    ux += uy
+    dist = np.sqrt(ux.min(axis=1))
+
+    return np.where(inside, dist, -dist)
+
+
+def _as_polygon(polygon, index: int) -> Polygon:
+    """ Creates a Polygon from a shell, unless it already is one.
+
+    Args:
+        polygon (Polygon|np.ndarray): The polygon or its shell.
+        index (int): The index of the polygon in the batch, used in error messages.
+
+    Returns:
+        (Polygon) The polygon.
+    """
+    if isinstance(polygon, Polygon):
+        return polygon
+    try:
+        return Polygon(polygon)
+    except ValueError as e:
+        raise ValueError(f"Polygon {index} is invalid: {e}") from e
+
+
+def find_poles(polygons: list, precision: int=1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Approximate the pole of inaccessability of many polygons at once.
+
+    Polygons are grouped by their number of edges, so small polygons aren't padded to the size of
+    the largest one, and each group is solved in lockstep.
+
+    Args:
+        polygons (list): The polygons. Each item is either a Polygon or a shell accepted by Polygon.
+        precision (int): The precision of the quadtree. The lower the precision, the more accurate the result.
+
+    Returns:
+        (np.ndarray) The poles of inaccessability, of shape (n, 2).
+        (np.ndarray) The distances to the poles of inaccessability, of shape (n,).
+
+    Raises:
+        ValueError: If a shell isn't a valid polygon. The message includes the index of the shell.
+            Filter out degenerate contours (e.g. fewer than 3 distinct vertices) beforehand.
+    """
+    polygons = [_as_polygon(p, i) for i, p in enumerate(polygons)]
+    poles = np.empty((len(polygons), 2), dtype=np.float64)
+    distances = np.empty(len(polygons), dtype=np.float64)
+
+    # Group by the bit length of the number of edges, so padding at most doubles the edges
+    groups: dict[int, list[int]] = {}
+    for i, polygon in enumerate(polygons):
+        edge_count = len(polygon.shell) + sum(len(hole) for hole in polygon.holes)
+        groups.setdefault(edge_count.bit_length(), []).append(i)
+
+    for indices in groups.values():
+        poles[indices], distances[indices] = _find_poles_lockstep([polygons[i] for i in indices], precision)
+
+    return poles, distances
+
+
+def _find_poles_lockstep(polygons: list[Polygon], precision: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Approximate the pole of inaccessability of the polygons, advancing all of their quadtrees together.
+
+    Args:
+        polygons (list[Polygon]): The polygons. Must not be empty.
+        precision (int): The precision of the quadtree.
+
+    Returns:
+        (np.ndarray) The poles of inaccessability, of shape (n, 2).
+        (np.ndarray) The distances to the poles of inaccessability, of shape (n,).
+    """
+    # Edges and cells are kept relative to the first cell of their polygon
+    origins = np.array([polygon.centroid for polygon in polygons], dtype=np.float64)
+    edges = _pack_edges(polygons, origins)
+    chunk = max(1, _MAX_CHUNK // edges.shape[2])
+
+    def evaluate(owner: np.ndarray, points: np.ndarray) -> np.ndarray:
+        points = (points - origins[owner]).astype(np.float32)
+        return np.concatenate([
+            _signed_distances(edges[:, owner[i:i + chunk]], points[i:i + chunk])
+            for i in range(0, len(owner), chunk)
+        ]).astype(np.float64)
+
+    # Create the first cell to cover each polygon
+    owner = np.arange(len(polygons))
+    centers = origins.copy()
+    sizes = np.array([max(polygon.width, polygon.height) for polygon in polygons], dtype=np.float64)
+    distances = evaluate(owner, centers)
+
+    # The best cell of each polygon so far
+    best_poles = centers.copy()
+    best_distances = distances.copy()
+
+    # Offsets of the subdivisions, in the same order as Quadtree.subdivide. [NE, NW, SE, SW]
+    quadrants = np.array([[1, -1], [-1, -1], [1, 1], [-1, 1]], dtype=np.float64)
+
+    while True:
+        # Discard cells that can't contain a better pole within the given precision
+        radius = sizes * np.sqrt(0.5)
+        keep = distances + radius > best_distances[owner] + precision
+        owner, centers, sizes, distances = owner[keep], centers[keep], sizes[keep], distances[keep]
+        radius = radius[keep]
+
+        # Update the best cell of each polygon. Ties go to the first cell, like find_pole
+        better = distances > best_distances[owner]
+        if better.any():
+            idx = np.flatnonzero(better)
+            np.maximum.at(best_distances, owner[idx], distances[idx])
+            idx = idx[distances[idx] == best_distances[owner[idx]]]
+            polys, first = np.unique(owner[idx], return_index=True)
+            best_poles[polys] = centers[idx[first]]
+
+            # Discard again with the new best. find_pole compares each cell against the running best,
+            # but the whole level was compared against the previous best above
+            keep = distances + radius > best_distances[owner] + precision
+            owner, centers, sizes, distances = owner[keep], centers[keep], sizes[keep], distances[keep]
+
+        if not len(owner):
+            break
+
+        # Subdivide the remaining cells
+        owner = np.repeat(owner, 4)
+        centers = (centers[:, None, :] + quadrants * (sizes[:, None, None] / 4)).reshape(-1, 2)
+        sizes = np.repeat(sizes / 2, 4)
+        distances = evaluate(owner, centers)
+
+    return best_poles, best_distances
@@ -2,31 +2,177 @@
 import cv2
 import numpy as np
 
+# How far a hole may reach outside the shell, relative to the size of the shell.
+# Approximating curved rings with line segments often makes holes poke out slightly.
+_HOLE_TOLERANCE = 1e-3
+
+# Maximum number of (segment, edge) pairs tested for crossings at once, to bound memory use
+_MAX_CROSSING_PAIRS = 1 << 16
+
+
+def _normalize_ring(ring, clockwise: bool) -> np.ndarray:
+    """ Normalizes a single ring (shell or hole) of a polygon.
+
+    The ring is coerced to a contiguous float64 array of shape (n, 2), consecutive duplicate
+    vertices are removed, an explicit closing vertex is dropped (rings are always treated as closed)
+    and the vertex order is flipped if needed so the ring has the requested orientation.
+
+    Args:
+        ring (np.ndarray): The ring to normalize. Any array-like of shape (n, 2) or (n, 1, 2).
+        clockwise (bool): If true the ring is returned clockwise, otherwise counter-clockwise.
+            Orientation is measured in image coordinates (y axis pointing down).
+
+    Returns:
+        (np.ndarray) A new, read-only array of shape (n, 2).
+
+    Raises:
+        ValueError: If the ring is malformed or has no area.
+    """
+    ring = np.array(ring, dtype=np.float64)
+    if ring.ndim == 3:
+        ring = ring.reshape(ring.shape[0], 2)
+    if ring.ndim != 2 or ring.shape[1] != 2:
+        raise ValueError(f"Expected a ring of shape (n, 2) or (n, 1, 2), got {ring.shape}.")
+    if not np.all(np.isfinite(ring)):
+        raise ValueError("Ring contains non-finite coordinates.")
+
+    # Remove consecutive duplicates, including the closing vertex if the ring was explicitly closed
+    keep = np.any(ring != np.roll(ring, 1, axis=0), axis=1)
+    ring = ring[keep] if keep.any() else ring[:1]
+    if len(ring) < 3:
+        raise ValueError(f"A ring needs at least 3 distinct vertices, got {len(ring)}.")
+
+    # Shoelace formula. Positive area is clockwise when the y axis points down
+    x, y = ring[:, 0], ring[:, 1]
+    area = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    if area == 0:
+        raise ValueError("A ring needs a non-zero area, got a collinear ring.")
+    if (area > 0) != clockwise:
+        ring = ring[::-1]
+
+    ring = np.ascontiguousarray(ring)
+    ring.flags.writeable = False
+    return ring
+
+
+def _edge_crossings(start: np.ndarray, end: np.ndarray, ring: np.ndarray) -> list[np.ndarray]:
+    """ Finds where each segment properly crosses the edges of a ring.
+
+    Args:
+        start (np.ndarray): The start points of the segments, of shape (m, 2).
+        end (np.ndarray): The end points of the segments, of shape (m, 2).
+        ring (np.ndarray): The ring, of shape (n, 2).
+
+    Returns:
+        (list[np.ndarray]) For each segment, the sorted positions (0 to 1) along it where it crosses the ring.
+    """
+    e = (np.roll(ring, -1, axis=0) - ring)[None, :, :]
+    block = max(1, _MAX_CROSSING_PAIRS // len(ring))
+
+    def cross(a, b):
+        return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+    crossings = []
+    for i in range(0, len(start), block):
+        d = (end[i:i + block] - start[i:i + block])[:, None, :]
+        w = ring[None, :, :] - start[i:i + block, None, :]
+        denom = cross(d, e)
+        parallel = denom == 0
+        denom = np.where(parallel, 1, denom)
+        t = cross(w, e) / denom
+        u = cross(w, d) / denom
+        crosses = ~parallel & (t > 0) & (t < 1) & (u > 0) & (u < 1)
+        crossings.extend(np.sort(t[j][crosses[j]]) for j in range(len(d)))
+    return crossings
+
 
 class Polygon:
     
-    def __init__(self, shell: np.ndarray, holes:list[np.ndarray]=[]):
+    def __init__(self, shell: np.ndarray, holes: list[np.ndarray]|None = None):
         """ Creates a polygon.
         
+        The shell and holes are validated and normalized once here (see `_normalize_ring`), so a
+        polygon can be reused for any number of solves without being copied or cleaned again.
+        The polygon is immutable. The caller's arrays and list are never modified.
+        
         Args:
             shell (np.ndarray): The shell of the polygon. Expects a numpy array of shape (n, 2).
                 If the shape is (n, 1, 2), it will be reshaped to (n, 2). This is useful for cv2.findContours.
-            holes (list[np.ndarray]): The holes in the polygon.
+            holes (list[np.ndarray]): The holes in the polygon. Each hole must lie inside the shell.
+        
+        Raises:
+            ValueError: If a ring is malformed or a hole lies outside the shell.
         """
-        # Reshape the shell if needed
-        if len(shell.shape) == 3:
-            shell = shell.reshape(shell.shape[0], 2)
-        
-        # Reshape the holes if needed
-        if len(holes) > 0:
-            for i, hole in enumerate(holes):
-                if len(hole.shape) == 3:
-                    holes[i] = hole.reshape(hole.shape[0], 2)
-        
-        self.shell = shell
-        self.holes = holes
+        self._shell = _normalize_ring(shell, clockwise=True)
+        self._holes = tuple(_normalize_ring(hole, clockwise=False) for hole in (holes or []))
+        
+        # cv2 only accepts float32/int32 contours, so keep a copy for it
+        self._cv_shell = self._shell.astype(np.float32)
+        self._cv_holes = tuple(hole.astype(np.float32) for hole in self._holes)
+        
+        self._check_holes()
         self._calculate_key_points()
     
+    @property
+    def shell(self) -> np.ndarray:
+        """ (np.ndarray) The normalized, read-only shell of shape (n, 2). """
+        return self._shell
+    
+    @property
+    def holes(self) -> tuple[np.ndarray, ...]:
+        """ (tuple[np.ndarray]) The normalized, read-only holes. """
+        return self._holes
+    
+    @property
+    def centroid(self) -> np.ndarray:
+        """ (np.ndarray) The center of the bounding box of the polygon. """
+        return self._centroid
+    
+    @property
+    def width(self) -> float:
+        """ (float) The width of the polygon. """
+        return self._width
+    
+    @property
+    def height(self) -> float:
+        """ (float) The height of the polygon. """
+        return self._height
+    
+    def _check_holes(self):
+        """ Checks that every hole lies inside the shell.
+        
+        Every vertex of a hole, and every piece of a hole edge between the points where it crosses
+        the shell, must lie inside the shell. Parts of a hole may reach outside the shell by up to
+        `_HOLE_TOLERANCE` times the size of the shell, since approximating curved rings with line
+        segments often makes holes poke out slightly.
+        
+        Raises:
+            ValueError: If a hole lies outside the shell.
+        """
+        shell_min = self._shell.min(axis=0)
+        shell_max = self._shell.max(axis=0)
+        tolerance = _HOLE_TOLERANCE * np.max(shell_max - shell_min)
+        
+        def outside(point: np.ndarray) -> bool:
+            # cv2 expects a tuple of floats
+            return cv2.pointPolygonTest(self._cv_shell, (float(point[0]), float(point[1])), True) < -tolerance
+        
+        for i, hole in enumerate(self._holes):
+            if np.any(hole < shell_min - tolerance) or np.any(hole > shell_max + tolerance):
+                raise ValueError(f"Hole {i} does not lie inside the shell.")
+            if any(outside(vertex) for vertex in hole):
+                raise ValueError(f"Hole {i} does not lie inside the shell.")
+            
+            # Check the middle of each piece of the edges that cross the shell
+            end = np.roll(hole, -1, axis=0)
+            for start, stop, crossings in zip(hole, end, _edge_crossings(hole, end, self._shell)):
+                if not len(crossings):
+                    continue
+                positions = np.concatenate([[0], crossings, [1]])
+                middles = (positions[:-1] + positions[1:]) / 2
+                if any(outside(start + t * (stop - start)) for t in middles):
+                    raise ValueError(f"Hole {i} does not lie inside the shell.")
+    
     def _calculate_key_points(self):
         """ Calculates the key points of the polygon.
         
@@ -36,9 +182,10 @@ class Polygon:
             height (int): The height of the polygon.
         """
         bbox = self._get_bounding_box()
-        self.centroid = np.array([bbox[0], bbox[1]], dtype=int)
-        self.width = bbox[2]
-        self.height = bbox[3]
+        self._centroid = np.array([bbox[0], bbox[1]], dtype=int)
+        self._centroid.flags.writeable = False
+        self._width = bbox[2]
+        self._height = bbox[3]
     
     def _get_bounding_box(self) -> list[np.ndarray]:
         """ Gets the bounding box of the polygon
@@ -76,13 +223,13 @@ class Polygon:
         Returns:
             The minimum distance to the polygon edge. Positive if the point is inside the polygon, negative if outside.
         """
-        # Ensure point is of type 
-        point = np.array(point, dtype=np.float32)
+        # cv2 expects a tuple of floats
+        point = (float(point[0]), float(point[1]))
         
         # Calculate the distance to the shell
-        min_dist = cv2.pointPolygonTest(self.shell, point, True)  
+        min_dist = cv2.pointPolygonTest(self._cv_shell, point, True)  
 
-        for hole in self.holes:
+        for hole in self._cv_holes:
             # We need to invert the distance, since we dont want the point inside the hole
             hole_dist = cv2.pointPolygonTest(hole, point, True) * -1
             # Get the minimum distance
@@ -95,13 +95,13 @@ class Quadtree:
         
         return image
     
-def find_pole(shell:np.ndarray, holes:np.ndarray=[], precision: int=1, return_quadtree:bool=False) -> np.array:
+def find_pole(shell:np.ndarray, holes:list[np.ndarray]|None=None, precision: int=1, return_quadtree:bool=False) -> np.array:
     """
     Approximate the pole of inaccessability of the polygon.
     
     Args:
         shell (np.ndarray): The shell of the polygon.
-        holes (np.ndarray): The holes in the polygon.
+        holes (list[np.ndarray]): The holes in the polygon.
         precision (int): The precision of the quadtree. The lower the precision, the more accurate the result.
         return_quadtree (bool): If true, the quadtree will be returned as well.
     
@@ -110,9 +110,26 @@ def find_pole(shell:np.ndarray, holes:np.ndarray=[], precision: int=1, return_qu
         (float) The distance to the pole of inaccessability.
         (Quadtree)[optional] The quadtree used to find the pole of inaccessability.
     """
-    # Create polygon
-    polygon:Polygon = Polygon(shell, holes)
+    return find_pole_polygon(Polygon(shell, holes), precision, return_quadtree)
+
+
+def find_pole_polygon(polygon: Polygon, precision: int=1, return_quadtree:bool=False) -> np.array:
+    """
+    Approximate the pole of inaccessability of the polygon.
+    
+    The polygon is already normalized, so it is used as is. Prefer this over `find_pole` 
+    when solving the same polygon more than once.
+    
+    Args:
+        polygon (Polygon): The polygon.
+        precision (int): The precision of the quadtree. The lower the precision, the more accurate the result.
+        return_quadtree (bool): If true, the quadtree will be returned as well.
     
+    Returns:
+        (np.ndarray) The pole of inaccessability of the polygon.
+        (float) The distance to the pole of inaccessability.
+        (Quadtree)[optional] The quadtree used to find the pole of inaccessability.
+    """
     # Create the quadtree
     size:int = max(polygon.width, polygon.height) # Size of the first quad in the tree
      
@@ -150,13 +167,3 @@ def find_pole(shell:np.ndarray, holes:np.ndarray=[], precision: int=1, return_qu
         return np.array([best_quad.x, best_quad.y]), best_quad.distance, root
     return np.array([best_quad.x, best_quad.y]), best_quad.distance
 
-
-def find_pole_polygon(polygon: Polygon, precision: int=1) -> np.array:
-    """
-    Approximate the pole of inaccessability of the polygon.
-    
-    Args:
-        polygon (Polygon): The polygon.
-        precision (int): The precision of the quadtree. The lower the precision, the more accurate the result.
-    """
-    return find_pole(polygon.shell, polygon.holes, precision)
\ No newline at end of file
@@ -25,14 +25,8 @@ def translate(polygon: Polygon, x: int, y: int) -> Polygon:
         Polygon: The translated polygon.
     """
     # Translate the polygon
-    polygon.shell[:, 0] += x
-    polygon.shell[:, 1] += y
-    for hole in polygon.holes:
-        hole[:, 0] += x
-        hole[:, 1] += y
-        
-    polygon._calculate_key_points()
-    return polygon
+    offset = np.array([x, y])
+    return Polygon(polygon.shell + offset, [hole + offset for hole in polygon.holes])
 
 
 def scale(polygon: Polygon, scale: float) -> Polygon:
@@ -46,14 +40,7 @@ def scale(polygon: Polygon, scale: float) -> Polygon:
         Polygon: The scaled polygon.
     """
     # Scale the polygon
-    polygon.shell[:, 0] *= scale
-    polygon.shell[:, 1] *= scale
-    for hole in polygon.holes:
-        hole[:, 0] *= scale
-        hole[:, 1] *= scale
-        
-    polygon._calculate_key_points()
-    return polygon
+    return Polygon(polygon.shell * scale, [hole * scale for hole in polygon.holes])
 
 
 def create_rectangle(width: int, height: int) -> Polygon:
@@ -142,5 +129,4 @@ def create_hole(polygon: Polygon, hole: Polygon) -> Polygon:
     Returns:
         A Polygon of the polygon with the hole.
     """
-    polygon.holes.append(hole.shell)
-    return polygon
\ No newline at end of file
+    return Polygon(polygon.shell, [*polygon.holes, hole.shell])
\ No newline at end of file
@@ -0,0 +1,61 @@
+from visual_center.batch import find_poles
+from visual_center.quadtree import find_pole_polygon
+import visual_center.tests.example_polys as example_polys
+from visual_center.polygon import Polygon
+import numpy as np
+import pytest
+
+
+def test_find_poles_matches_find_pole() -> None:
+    """ Test that find_poles finds the same poles as find_pole, within the precision """
+    # Circle with square holes
+    circle = example_polys.create_circle(500)
+    square1 = example_polys.translate(example_polys.create_rectangle(400, 250), 200, 100)
+    square2 = example_polys.translate(example_polys.create_rectangle(150, 150), 550, 550)
+    circle = example_polys.create_hole(circle, square1)
+    circle = example_polys.create_hole(circle, square2)
+    
+    polygons = [
+        example_polys.create_rectangle(50, 50),
+        example_polys.create_donut(100, 300, 100),
+        example_polys.create_circle(20, 12),
+        circle,
+    ]
+    # Many small random polygons
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = rng.integers(10, 50)
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radii = rng.uniform(20, 60, n)
+        polygons.append(np.c_[100 + radii * np.cos(angles), 100 + radii * np.sin(angles)])
+    
+    poles, distances = find_poles(polygons, precision=1)
+    
+    assert poles.shape == (len(polygons), 2), f"Expected shape {(len(polygons), 2)}, got {poles.shape}"
+    assert distances.shape == (len(polygons),), f"Expected shape {(len(polygons),)}, got {distances.shape}"
+    for i, (polygon, pole, distance) in enumerate(zip(polygons, poles, distances)):
+        polygon = Polygon(polygon) if isinstance(polygon, np.ndarray) else polygon
+        _, expected = find_pole_polygon(polygon, precision=1)
+        assert abs(distance - expected) <= 1, f"Expected distance {expected}, got {distance}. Index {i}."
+        assert abs(polygon.signed_distance(pole) - distance) < 1e-3, f"Distance doesn't match the pole. Index {i}."
+
+
+def test_find_poles_square() -> None:
+    """ Test find_poles on a simple square """
+    square = example_polys.create_rectangle(50, 50)
+    poles, distances = find_poles([square, square.shell], precision=1)
+    assert np.all(poles == np.array([[25, 25], [25, 25]])), f"Expected [25, 25], got {poles}"
+    assert np.all(distances == 25), f"Expected 25, got {distances}"
+
+
+def test_find_poles_empty() -> None:
+    """ Test find_poles with no polygons """
+    poles, distances = find_poles([])
+    assert poles.shape == (0, 2) and distances.shape == (0,)
+
+
+def test_find_poles_invalid() -> None:
+    """ Test that an invalid polygon raises with its index """
+    square = example_polys.create_rectangle(50, 50)
+    with pytest.raises(ValueError, match="Polygon 1 "):
+        find_poles([square, [[0, 0], [10, 0]]])
@@ -1,6 +1,8 @@
 import cv2
 import numpy as np
+import pytest
 import visual_center.tests.example_polys as example_poly
+from visual_center.polygon import Polygon
 
 
 def test_distance_square() -> None:
@@ -42,7 +44,7 @@ def test_distance_square_with_hole() -> None:
     hole = example_poly.create_rectangle(50, 50)
     
     # Translates hole 25 to the right and down
-    hole.shell =  np.array([p + [25, 25] for p in hole.shell])
+    hole = example_poly.translate(hole, 25, 25)
     
     square = example_poly.create_hole(square, hole)
     
@@ -134,3 +136,91 @@ def test_get_polygon_key_points() -> None:
     expected_key_points = np.array([100, 99, 200.0, 199])
 
     assert np.all(key_points == expected_key_points), f"Expected key points {expected_key_points}, got {key_points}."
+
+
+def test_polygon_normalization() -> None:
+    """ Tests that the shell and holes are normalized once on construction. """
+    # Explicitly closed, counter-clockwise, integer shell with a duplicate vertex
+    shell = np.array([[0, 0], [0, 100], [0, 100], [100, 100], [100, 0], [0, 0]], dtype=np.int32)
+    hole = np.array([[25, 25], [75, 25], [75, 75], [25, 75]]).reshape(-1, 1, 2)
+    holes = [hole]
+    polygon = Polygon(shell, holes)
+    
+    # The input is left untouched
+    assert holes[0] is hole and hole.shape == (4, 1, 2), "Expected the caller's holes to be untouched."
+    assert shell.shape == (6, 2), "Expected the caller's shell to be untouched."
+    
+    # Duplicate and closing vertices are removed, and the result is contiguous float64
+    assert polygon.shell.shape == (4, 2), f"Expected 4 vertices, got {polygon.shell.shape}."
+    assert polygon.shell.dtype == np.float64 and polygon.shell.flags.c_contiguous
+    assert polygon.holes[0].shape == (4, 2), f"Expected 4 vertices, got {polygon.holes[0].shape}."
+    
+    # Shell is clockwise and holes are counter-clockwise (image coordinates)
+    def area(ring: np.ndarray) -> float:
+        return np.dot(ring[:, 0], np.roll(ring[:, 1], -1)) - np.dot(ring[:, 1], np.roll(ring[:, 0], -1))
+    assert area(polygon.shell) > 0, "Expected the shell to be clockwise."
+    assert area(polygon.holes[0]) < 0, "Expected the hole to be counter-clockwise."
+    
+    # Normalized arrays are read-only
+    with pytest.raises(ValueError):
+        polygon.shell[0, 0] = 1
+    with pytest.raises(AttributeError):
+        polygon.shell = shell
+    
+    # No shared default for the holes
+    assert Polygon(shell).holes == () and Polygon(shell).holes is not None
+
+
+def test_polygon_validation() -> None:
+    """ Tests that malformed polygons are rejected. """
+    square = [[0, 0], [100, 0], [100, 100], [0, 100]]
+    
+    with pytest.raises(ValueError):
+        Polygon([[0, 0], [100, 0], [100, 0], [0, 0]])
+    with pytest.raises(ValueError):
+        Polygon(np.zeros((4, 3)))
+    with pytest.raises(ValueError):
+        # Hole outside of the shell
+        Polygon(square, [[[200, 200], [250, 200], [250, 250]]])
+    with pytest.raises(ValueError):
+        # Collinear ring with no area
+        Polygon([[0, 0], [10, 0], [20, 0]])
+
+
+def test_polygon_hole_on_shell_bounds() -> None:
+    """ Tests that a hole touching the shell's bounding box at a coordinate float32 can't represent is accepted. """
+    hole = [[0.05, 0.02], [0.1, 0.05], [0.05, 0.08]]
+    polygon = Polygon([[0, 0], [0.1, 0], [0.1, 0.1], [0, 0.1]], [hole])
+    assert len(polygon.holes) == 1, f"Expected 1 hole, got {len(polygon.holes)}."
+    
+    # Same polygon at large coordinates
+    offset = np.array([1e6, 1e6])
+    polygon = Polygon(np.array([[0, 0], [0.1, 0], [0.1, 0.1], [0, 0.1]]) + offset, [np.array(hole) + offset])
+    assert len(polygon.holes) == 1, f"Expected 1 hole, got {len(polygon.holes)}."
+
+
+def test_polygon_hole_crossing_shell() -> None:
+    """ Tests that a hole crossing a concave shell is rejected, even if all its vertices are inside. """
+    # U shape with arms from x=0 to 10 and x=20 to 30
+    u_shape = [[0, 0], [10, 0], [10, 20], [20, 20], [20, 0], [30, 0], [30, 30], [0, 30]]
+    
+    with pytest.raises(ValueError):
+        # Spans both arms, every vertex is inside the shell
+        Polygon(u_shape, [[[5, 5], [25, 5], [25, 10], [5, 10]]])
+    with pytest.raises(ValueError):
+        # Vertices right next to the inner walls of the arms
+        Polygon(u_shape, [[[9.99, 5], [20.01, 5], [20.01, 10], [9.99, 10]]])
+    
+    # Holes inside the shell are accepted
+    polygon = Polygon(u_shape, [[[2, 22], [28, 22], [28, 28], [2, 28]], [[2, 2], [8, 2], [8, 18]]])
+    assert len(polygon.holes) == 2, f"Expected 2 holes, got {len(polygon.holes)}."
+
+
+def test_polygon_large_rings() -> None:
+    """ Tests that a polygon with large rings, like cv2.findContours output, can be created. """
+    angles = np.linspace(0, 2 * np.pi, 8000, endpoint=False)
+    shell = np.c_[5000 + 4000 * np.cos(angles), 5000 + 4000 * np.sin(angles)]
+    hole = np.c_[5000 + 2000 * np.cos(angles), 5000 + 2000 * np.sin(angles)]
+    polygon = Polygon(shell, [hole])
+    assert polygon.shell.shape == (8000, 2), f"Expected 8000 vertices, got {polygon.shell.shape}."
+    assert polygon.holes[0].shape == (8000, 2), f"Expected 8000 vertices, got {polygon.holes[0].shape}."
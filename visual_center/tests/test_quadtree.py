@@ -62,15 +62,15 @@ def save_image(filename:str, polygon:Polygon, pole:np.ndarray, distance:float, q
     # Using the polygons width, height, centroid.x and centroid.y
     image = np.zeros((max_y + min_y, max_x + min_x, 4), dtype=np.uint8)
 
-    # Convert shell and holes to uint8  
-    polygon.shell = polygon.shell.astype(int)
-    polygon.holes = [hole.astype(int) for hole in polygon.holes]
+    # Convert shell and holes to int
+    shell = polygon.shell.astype(int)
+    holes = [hole.astype(int) for hole in polygon.holes]
     pole = pole.astype(int)
     
     # Draw the polygon
-    cv2.fillPoly(image, [polygon.shell], (200, 200, 200, 255))
+    cv2.fillPoly(image, [shell], (200, 200, 200, 255))
     # Draw the holes
-    for hole in polygon.holes:
+    for hole in holes:
         cv2.fillPoly(image, [hole], (0, 0, 0, 0))
     
     